@@ -23,7 +23,7 @@ def draw_bounding_boxes(img, data, legend=True):
   
   # colormap 
   cmap = plt.cm.get_cmap("jet")
-  color_ls = np.linspace(0,1,num=classes.size)
+  colors = cmap(np.linspace(0,1,num=classes.size))[:, :3]
   
   # draw bounding boxes
   fig, ax = plt.subplots(figsize=[6,4], dpi=100)
@@ -34,14 +34,14 @@ def draw_bounding_boxes(img, data, legend=True):
     display(data)
     class_num = np.squeeze(np.argwhere(data["class_name"][i]==classes))
     rect = Rectangle((data["x"][i],data["y"][i]),data["width"][i],data["height"][i],
-                                 edgecolor=cmap(color_ls[class_num])[:3], 
+                                 edgecolor=colors[class_num], 
                                  linewidth=1, facecolor='none')
     ax.add_patch(rect)
 
   ax.set_title("Bounding boxes")  
   # legend
   if legend: 
-    legend_elements = [Patch(facecolor='none',edgecolor=cmap(color_ls[i])[:3],label=c) for i,c in enumerate(classes)]
+    legend_elements = [Patch(facecolor='none',edgecolor=colors[i],label=c) for i,c in enumerate(classes)]
     ax.legend(handles=legend_elements, loc='upper right')
   
   plt.show()
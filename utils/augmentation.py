@@ -218,6 +218,9 @@ def aug_minor(csv_file, crop_height, crop_width, output_dir, minor_species, over
     image = Image.open(image_file)
     width, height = image.size
 
+    # hashed membership tests for species lookups below
+    minor_species = frozenset(minor_species)
+
     # Select out all minority birds
     minors = []
     valid_i = 0
@@ -26,6 +26,9 @@ def add_retinanet_config(args):
     cfg.MODEL.RETINANET.FOCAL_LOSS_GAMMA = args.focal_loss_gamma
     cfg.MODEL.RETINANET.FOCAL_LOSS_ALPHA = args.focal_loss_alpha
     cfg.SOLVER.WEIGHT_DECAY = args.weight_decay
+    # no weight decay on biases and normalization layer parameters
+    cfg.SOLVER.WEIGHT_DECAY_NORM = 0.0
+    cfg.SOLVER.WEIGHT_DECAY_BIAS = 0.0
     # solver parameters
     cfg.SOLVER.IMS_PER_BATCH = args.batch_size
     cfg.SOLVER.BASE_LR = args.learning_rate
@@ -58,6 +61,9 @@ def add_fasterrcnn_config(args):
 
     # loss parameters
     cfg.SOLVER.WEIGHT_DECAY = args.weight_decay
+    # no weight decay on biases and normalization layer parameters
+    cfg.SOLVER.WEIGHT_DECAY_NORM = 0.0
+    cfg.SOLVER.WEIGHT_DECAY_BIAS = 0.0
     # solver parameters
     cfg.SOLVER.IMS_PER_BATCH = args.batch_size
     cfg.SOLVER.BASE_LR = args.learning_rate
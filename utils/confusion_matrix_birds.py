@@ -100,18 +100,12 @@ def confusion_matrix_report(data_cat_name, predictor, bird_species, img_ext = 'J
         pred_species = (lst[-1][1]).numpy()
 
         # keeps track of found birds, if not then it in the not found category
-        found = []
+        found = set()
         miss_bird = 0
         # get the ground truth
         annt_bbx = pd.read_csv(file.replace(img_ext, 'csv'))
 
-        if 'TRASH' in annt_bbx['class_id'].unique():
-            drop_index = []
-            for ind, val in enumerate(annt_bbx['class_id']):
-                if val == 'TRASH':
-                    drop_index.append(ind)
-
-            annt_bbx.drop(index=drop_index, inplace=True)
+        annt_bbx = annt_bbx[annt_bbx['class_id'] != 'TRASH']
 
         annt_bbx = annt_bbx[['x', 'y', 'width', 'height']].to_numpy()
         # compare the anntation and the prediction
@@ -132,7 +126,7 @@ def confusion_matrix_report(data_cat_name, predictor, bird_species, img_ext = 'J
                 if iou_val >= iou_thre:
                     # append the prediction to the list
                     pred_total.append(pred_species[i])
-                    found.append(i)
+                    found.add(i)
                     ff = 1
                     break
             # if bird is not found then we append an extra category saying it was not found
@@ -1,6 +1,5 @@
 import pandas as pd
 from tqdm.autonotebook import tqdm
-import cv2
 from PIL import Image, ImageDraw
 import csv
 import os
@@ -8,6 +7,26 @@ import shutil
 from pathlib import Path
 import random
 
+# EXIF tag holding the image orientation
+ORIENTATION_TAG = 0x0112
+
+
+def get_img_size(img_path):
+    """
+    Function to read image size from the file header without decoding the pixel data
+    INPUT:
+      img_path -- path to image file
+    OUTPUT:
+      height, width -- image size after applying EXIF orientation, as returned by cv2.imread
+    """
+    with Image.open(img_path) as im:
+        width, height = im.size
+        # EXIF orientations 5-8 are rotated by 90 degrees
+        if im.getexif().get(ORIENTATION_TAG, 1) in (5, 6, 7, 8):
+            width, height = height, width
+    return height, width
+
+
 def csv_to_dict(csv_path, class_map = {}, annot_file_ext='csv', img_ext = 'jpg'):
     """
     Function to extract an info dictionary from an xml file
@@ -23,15 +42,15 @@ def csv_to_dict(csv_path, class_map = {}, annot_file_ext='csv', img_ext = 'jpg')
     info_dict['file_name'] = os.path.split(csv_path)[-1]
     # plotting function needs it, but in JPEG.
     
-    im = cv2.imread(csv_path.replace(annot_file_ext, img_ext))
+    height, width = get_img_size(csv_path.replace(annot_file_ext, img_ext))
 
     # append width, height, depth
-    info_dict['img_size'] = im.shape
+    info_dict['img_size'] = (height, width, 3)
     # bndbox info
-    for i in range(len(df)):
+    for obj_class, desc, xmin, ymin, w, h in df.itertuples(index=False, name=None):
         # store bbx info for one object
         bbox = {}
-        bbox['class'], bbox['desc'], bbox['xmin'], bbox['ymin'], w, h = df.iloc[i,]
+        bbox['class'], bbox['desc'], bbox['xmin'], bbox['ymin'] = obj_class, desc, xmin, ymin
         if class_map != {}:
             bbox['class'] = class_map[bbox['desc']]
         bbox['xmax'] = bbox['xmin'] + w
@@ -185,9 +204,7 @@ def crop_img(csv_file, crop_height, crop_width, output_dir, img_ext, class_map =
             if tile_annot(left, right, top, bottom, info_dict, i, j, crop_height, crop_width, overlap, file_dict):
 
                 c_img = im.crop((left, top, right, bottom))
-                c_img.save(os.path.join(output_dir, 'Intermediate/') + file_name + '_' + str(i) + '_' + str(j), 'JPEG')
-                image = Image.open(os.path.join(output_dir, 'Intermediate/') + file_name + '_' + str(i) + '_' + str(j))
-                image.save(output_dir + '/' + file_name + '_' + str(i) + '_' + str(j) + '.JPEG')
+                c_img.save(output_dir + '/' + file_name + '_' + str(i) + '_' + str(j) + '.JPEG')
 
     # output the file_dict to a folder of csv files containing labels for each cropped file
     for b in file_dict:
@@ -209,13 +226,10 @@ def crop_dataset(data_dir, output_dir, img_ext, annot_file_ext = 'csv', class_ma
     :param crop_width: image width after tiling, default 640
     """
 
-    # intermediate folder for cropped images
+    # output folder for cropped images
     if not os.path.exists(output_dir):
         print(f"Creating output directory at: {output_dir}")
         os.makedirs(output_dir)
-        os.makedirs(os.path.join(output_dir, 'Intermediate'))
-    elif not os.path.exists(os.path.join(output_dir, 'Intermediate')):
-        os.makedirs(os.path.join(output_dir, 'Intermediate'))
 
     # Load CSV files
     if annot_file_ext == 'csv':
@@ -229,8 +243,6 @@ def crop_dataset(data_dir, output_dir, img_ext, annot_file_ext = 'csv', class_ma
         crop_img(csv_file=f, crop_height=crop_height, crop_width=crop_width, output_dir=output_dir, class_map=class_map,
                  annot_file_ext=annot_file_ext, img_ext = img_ext)
 
-    shutil.rmtree(os.path.join(output_dir, 'Intermediate'))
-
 
 def crop_img_only(img_file_path, output_path, crop_height, crop_width, sliding_size):
     """
@@ -238,9 +250,7 @@ def crop_img_only(img_file_path, output_path, crop_height, crop_width, sliding_s
     INPUT:
     crop_height, crop_weight -- desired patch size.
     """
-    # append width, height, depth
-    im = cv2.imread(img_file_path)
-    img_height, img_width, _ = im.shape
+    img_height, img_width = get_img_size(img_file_path)
     im = Image.open(img_file_path, 'r')
     _, file_name_full = os.path.split(img_file_path)
     file_name, _ = os.path.splitext(file_name_full)
@@ -278,9 +288,7 @@ def crop_img_only(img_file_path, output_path, crop_height, crop_width, sliding_s
                 bottom = img_height
 
             c_img = im.crop((left, top, right, bottom))
-            c_img.save(os.path.join(output_path, 'Intermediate/') + file_name + '_' + str(i) + '_' + str(j), 'JPEG')
-            image = Image.open(os.path.join(output_path, 'Intermediate/') + file_name + '_' + str(i) + '_' + str(j))
-            image.save(os.path.join(output_path, file_name + '_' + str(i) + '_' + str(j) + '.JPEG'))
+            c_img.save(os.path.join(output_path, file_name + '_' + str(i) + '_' + str(j) + '.JPEG'))
 
 
 def crop_dataset_img_only(data_dir, img_ext, output_dir, crop_height=640, crop_width=640, sliding_size=400):
@@ -296,13 +304,10 @@ def crop_dataset_img_only(data_dir, img_ext, output_dir, crop_height=640, crop_w
         :param sliding_size: sliding size between each crop, default 400
     """
     
-    # intermediate folder for cropped images
+    # output folder for cropped images
     if not os.path.exists(output_dir):
         print(f"Creating output directory at: {output_dir}")
         os.makedirs(output_dir)
-        os.makedirs(os.path.join(output_dir, 'Intermediate'))
-    elif not os.path.exists(os.path.join(output_dir, 'Intermediate')):
-        os.makedirs(os.path.join(output_dir, 'Intermediate'))
     
     # Load CSV files
 
@@ -310,8 +315,6 @@ def crop_dataset_img_only(data_dir, img_ext, output_dir, crop_height=640, crop_w
     for f in tqdm(files):
         f = os.path.join(data_dir, f)
         crop_img_only(f, output_dir, crop_height, crop_width, sliding_size)
-    # remove intermediate folder
-    shutil.rmtree(os.path.join(output_dir, 'Intermediate'))
 
 
 def crop_dataset_img_only_hank(data_dir, img_ext, output_dir, crop_height=640, crop_width=640, sliding_size=400):
@@ -327,13 +330,10 @@ def crop_dataset_img_only_hank(data_dir, img_ext, output_dir, crop_height=640, c
         :param sliding_size: sliding size between each crop, default 400
     """
 
-    # intermediate folder for cropped images
+    # output folder for cropped images
     if not os.path.exists(output_dir):
         print(f"Creating output directory at: {output_dir}")
         os.makedirs(output_dir)
-        os.makedirs(os.path.join(output_dir, 'Intermediate'))
-    elif not os.path.exists(os.path.join(output_dir, 'Intermediate')):
-        os.makedirs(os.path.join(output_dir, 'Intermediate'))
 
     # Load CSV files
 
@@ -343,8 +343,6 @@ def crop_dataset_img_only_hank(data_dir, img_ext, output_dir, crop_height=640, c
     for f in tqdm(files):
         f = os.path.join(data_dir, f)
         crop_img_only(f, output_dir, crop_height, crop_width, sliding_size)
-    # remove intermediate folder
-    shutil.rmtree(os.path.join(output_dir, 'Intermediate'))
 
 def train_val_test_split(file_dir, output_dir, train_frac=0.8, val_frac=0.1, seed=4):
     """
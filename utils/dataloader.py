@@ -1,10 +1,12 @@
-import glob, os
-from cv2 import imread
+import copy, glob, os
+import numpy as np
 import pandas as pd
 
 from detectron2.structures import BoxMode
 from detectron2.data import MetadataCatalog, DatasetCatalog
 
+from .cropping import get_img_size
+
 def get_bird_only_dicts(data_dir,img_ext='.JPG'):
   """
   Format dataset to detectron2 standard format. 
@@ -24,7 +26,7 @@ def get_bird_only_dicts(data_dir,img_ext='.JPG'):
     # image attributes 
     root, ext = os.path.splitext(file_csv)    
     file_img = root + img_ext
-    height, width = imread(file_img).shape[:2]
+    height, width = get_img_size(file_img)
     record["file_name"] = file_img
     record["image_id"] = idx
     record["height"] = height
@@ -38,14 +40,8 @@ def get_bird_only_dicts(data_dir,img_ext='.JPG'):
     # remove annotations for trash 
     imgs_anns_df = imgs_anns_df[imgs_anns_df["class_name"]!="Trash/Debris"]
     
-    objs = []
-    for idx, row in imgs_anns_df.iterrows():  
-      obj = {
-          "bbox": [row["x"], row["y"], row["width"], row["height"]],      
-          "bbox_mode": BoxMode.XYWH_ABS,
-          "category_id": 0,
-      }
-      objs.append(obj)
+    bboxes = imgs_anns_df[["x", "y", "width", "height"]].to_numpy().tolist()
+    objs = [{"bbox": bbox, "bbox_mode": BoxMode.XYWH_ABS, "category_id": 0} for bbox in bboxes]
 
     record["annotations"] = objs
     dataset_dicts.append(record)
@@ -74,7 +70,7 @@ def get_bird_species_dicts(data_dir,class_names,img_ext='.JPG',unknown_bird_cate
     # image attributes
     root, ext = os.path.splitext(file_csv)
     file_img = root + img_ext
-    height, width = imread(file_img).shape[:2]
+    height, width = get_img_size(file_img)
     record["file_name"] = file_img
     record["image_id"] = idx
     record["height"] = height
@@ -88,28 +84,17 @@ def get_bird_species_dicts(data_dir,class_names,img_ext='.JPG',unknown_bird_cate
     # remove annotations for trash
     imgs_anns_df = imgs_anns_df[imgs_anns_df["class_name"]!="Trash/Debris"]
 
-    objs = []
-    for idx, row in imgs_anns_df.iterrows():
-      obj = None
-      for id, class_name in enumerate(class_names):
-        if class_name in row["class_name"]:
-          obj = {
-            "bbox": [row["x"], row["y"], row["width"], row["height"]],
-            "bbox_mode": BoxMode.XYWH_ABS,
-            "category_id": id,
-          }
-          objs.append(obj)
-          break
-      if obj is None:
-        if unknown_bird_category:
-          obj = {
-            "bbox": [row["x"], row["y"], row["width"], row["height"]],
-            "bbox_mode": BoxMode.XYWH_ABS,
-            "category_id": len(class_names)
-          }
-          objs.append(obj)
-        else:
-          continue
+    # category of first species name found in each annotation, unknown birds get len(class_names)
+    category_ids = np.full(imgs_anns_df.shape[0], len(class_names))
+    for id, class_name in reversed(list(enumerate(class_names))):
+      category_ids[imgs_anns_df["class_name"].str.contains(class_name, regex=False, na=False).to_numpy()] = id
+    bboxes = imgs_anns_df[["x", "y", "width", "height"]].to_numpy()
+    if not unknown_bird_category:
+      known = category_ids < len(class_names)
+      bboxes, category_ids = bboxes[known], category_ids[known]
+
+    objs = [{"bbox": bbox, "bbox_mode": BoxMode.XYWH_ABS, "category_id": category_id}
+            for bbox, category_id in zip(bboxes.tolist(), category_ids.tolist())]
 
     record["annotations"] = objs
     dataset_dicts.append(record)
@@ -117,6 +102,26 @@ def get_bird_species_dicts(data_dir,class_names,img_ext='.JPG',unknown_bird_cate
   return dataset_dicts
 
 
+def cache_dataset_dicts(get_dicts):
+  """
+  Wrap a dataset function so its annotation files are only parsed on the first call.
+  Detectron2's DatasetCatalog calls the registered function every time a dataset is requested
+  (training loader, evaluators, visualization), so repeated calls return a copy of the cached dicts.
+  INPUTS:
+    get_dicts -- function with no arguments returning a list of dictionaries in detectron2 standard format
+  OUTPUTS:
+    cached_get_dicts -- function with no arguments returning a copy of the cached list
+  """
+  cache = {}
+
+  def cached_get_dicts():
+    if "dataset_dicts" not in cache:
+      cache["dataset_dicts"] = get_dicts()
+    return copy.deepcopy(cache["dataset_dicts"])
+
+  return cached_get_dicts
+
+
 def register_datasets(data_dirs, img_ext, birds_species_names, bird_species_colors=None):
   """
   Register dataset as part of Detectron2's dataset and metadataset catalogs
@@ -135,7 +140,8 @@ def register_datasets(data_dirs, img_ext, birds_species_names, bird_species_colo
     # birds only
     if f"birds_only_{d}" in DatasetCatalog.list():
       DatasetCatalog.remove(f"birds_only_{d}")
-    DatasetCatalog.register(f"birds_only_{d}", lambda d=d: get_bird_only_dicts(data_dir, img_ext))
+    DatasetCatalog.register(f"birds_only_{d}",
+                            cache_dataset_dicts(lambda data_dir=data_dir: get_bird_only_dicts(data_dir, img_ext)))
     if f"birds_only_{d}" in MetadataCatalog.list():
       MetadataCatalog.remove(f"birds_only_{d}")
     MetadataCatalog.get(f"birds_only_{d}").set(thing_classes=["Bird"])
@@ -143,10 +149,11 @@ def register_datasets(data_dirs, img_ext, birds_species_names, bird_species_colo
     # bird species
     if f"birds_species_{d}" in DatasetCatalog.list():
       DatasetCatalog.remove(f"birds_species_{d}")
-    DatasetCatalog.register(f"birds_species_{d}", lambda d=d: get_bird_species_dicts(data_dir,
-                                                                                     birds_species_names,
-                                                                                     img_ext,
-                                                                                     unknown_bird_category=True))
+    DatasetCatalog.register(f"birds_species_{d}",
+                            cache_dataset_dicts(lambda data_dir=data_dir: get_bird_species_dicts(data_dir,
+                                                                                                 birds_species_names,
+                                                                                                 img_ext,
+                                                                                                 unknown_bird_category=True)))
     if f"birds_species_{d}" in MetadataCatalog.list():
       MetadataCatalog.remove(f"birds_species_{d}")
     MetadataCatalog.get(f"birds_species_{d}").set(thing_classes=birds_species_names + ["Unknown Bird"])
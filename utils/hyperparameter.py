@@ -56,6 +56,9 @@ def setup(cfg_parms):
     cfg.SOLVER.MAX_ITER = cfg_parms['MAX_ITER']
     cfg.SOLVER.STEPS = cfg_parms['STEPS']
     cfg.SOLVER.CHECKPOINT_PERIOD = cfg_parms['CHECKPOINT_PERIOD']
+    # no weight decay on biases and normalization layer parameters
+    cfg.SOLVER.WEIGHT_DECAY_NORM = 0.0
+    cfg.SOLVER.WEIGHT_DECAY_BIAS = 0.0
     cfg.MODEL.weight = cfg_parms['weight']
 
     # naming needs to be updated
@@ -90,6 +93,9 @@ def setup1(cfg_parms):
     cfg.SOLVER.MAX_ITER = cfg_parms['MAX_ITER']
     cfg.SOLVER.STEPS = cfg_parms['STEPS']
     cfg.SOLVER.CHECKPOINT_PERIOD = cfg_parms['CHECKPOINT_PERIOD']
+    # no weight decay on biases and normalization layer parameters
+    cfg.SOLVER.WEIGHT_DECAY_NORM = 0.0
+    cfg.SOLVER.WEIGHT_DECAY_BIAS = 0.0
 
     # naming needs to be updated
     cfg.OUTPUT_DIR = os.path.join(cfg_parms['output_dir'],
@@ -125,6 +131,9 @@ def setup_loss(cfg_parms):
     cfg.SOLVER.MAX_ITER = cfg_parms['MAX_ITER']
     cfg.SOLVER.STEPS = cfg_parms['STEPS']
     cfg.SOLVER.CHECKPOINT_PERIOD = cfg_parms['CHECKPOINT_PERIOD']
+    # no weight decay on biases and normalization layer parameters
+    cfg.SOLVER.WEIGHT_DECAY_NORM = 0.0
+    cfg.SOLVER.WEIGHT_DECAY_BIAS = 0.0
 
     weight = torch.from_numpy(
         np.array([1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1, 1, 1], dtype='float32')).to("cuda:0")
@@ -183,6 +192,9 @@ def setup_dense(cfg_parms):
     cfg.SOLVER.MAX_ITER = cfg_parms['MAX_ITER']
     cfg.SOLVER.STEPS = cfg_parms['STEPS']
     cfg.SOLVER.CHECKPOINT_PERIOD = cfg_parms['CHECKPOINT_PERIOD']
+    # no weight decay on biases and normalization layer parameters
+    cfg.SOLVER.WEIGHT_DECAY_NORM = 0.0
+    cfg.SOLVER.WEIGHT_DECAY_BIAS = 0.0
 
     cfg.DATASETS.TRAIN = ("birds_species_Train",)
     cfg.DATASETS.TEST = ("birds_species_Validate",)
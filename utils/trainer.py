@@ -1,3 +1,4 @@
+import inspect
 import numpy as np
 import torch
 
@@ -7,6 +8,38 @@ from detectron2.utils.events import EventWriter, get_event_storage
 from detectron2.data import DatasetMapper, build_detection_test_loader
 from detectron2.engine import DefaultTrainer
 from detectron2.evaluation import COCOEvaluator, DatasetEvaluators
+from detectron2.solver.build import get_default_optimizer_params, maybe_add_gradient_clipping
+
+
+def build_sgd_optimizer(cfg, model):
+    """
+    Build SGD optimizer with detectron2's default build_optimizer. If the installed torch version supports the
+    fused SGD update and the model is on CUDA, build the same parameter groups with fused=True instead.
+    Falls back to the default builder when AMP and gradient clipping are both enabled: fused SGD unscales
+    gradients inside step(), so AMPTrainer skips unscale_() and the clipping wrapper would clip scaled gradients
+    """
+    if "fused" not in inspect.signature(torch.optim.SGD).parameters or not cfg.MODEL.DEVICE.startswith("cuda"):
+        return DefaultTrainer.build_optimizer(cfg, model)
+    if cfg.SOLVER.AMP.ENABLED and cfg.SOLVER.CLIP_GRADIENTS.ENABLED:
+        return DefaultTrainer.build_optimizer(cfg, model)
+    # mirrors detectron2.solver.build.build_optimizer, keep arguments in sync with upstream
+    params = get_default_optimizer_params(
+        model,
+        base_lr=cfg.SOLVER.BASE_LR,
+        weight_decay=cfg.SOLVER.WEIGHT_DECAY,
+        weight_decay_norm=cfg.SOLVER.WEIGHT_DECAY_NORM,
+        bias_lr_factor=cfg.SOLVER.BIAS_LR_FACTOR,
+        weight_decay_bias=cfg.SOLVER.WEIGHT_DECAY_BIAS,
+    )
+    return maybe_add_gradient_clipping(cfg, torch.optim.SGD)(
+        params,
+        lr=cfg.SOLVER.BASE_LR,
+        momentum=cfg.SOLVER.MOMENTUM,
+        nesterov=cfg.SOLVER.NESTEROV,
+        weight_decay=cfg.SOLVER.WEIGHT_DECAY,
+        fused=True,
+    )
+
 
 class ValidationLossHook(HookBase): 
     """
@@ -20,8 +53,6 @@ class ValidationLossHook(HookBase):
     def _do_loss_eval(self): 
         losses = []
         for idx, inputs in enumerate(self._data_loader):            
-            if torch.cuda.is_available():
-                torch.cuda.synchronize()
             loss_batch = self._get_loss(inputs)
             losses.append(loss_batch)
         
@@ -33,13 +64,13 @@ class ValidationLossHook(HookBase):
             
     def _get_loss(self, data):
         # How loss is calculated on train_loop 
-        metrics_dict = self._model(data)
-        metrics_dict = {
-            k: v.detach().cpu().item() if isinstance(v, torch.Tensor) else float(v)
-            for k, v in metrics_dict.items()
-        }
-        total_losses_reduced = sum(loss for loss in metrics_dict.values())
-        return total_losses_reduced
+        with torch.no_grad():
+            metrics_dict = self._model(data)
+        # sum losses on device so only the total is copied back to the host
+        total_losses_reduced = sum(metrics_dict.values())
+        if isinstance(total_losses_reduced, torch.Tensor):
+            total_losses_reduced = total_losses_reduced.detach().cpu().item()
+        return float(total_losses_reduced)
 
     def after_step(self):
         next_iter = self.trainer.iter + 1
@@ -63,6 +94,10 @@ class Trainer(DefaultTrainer):
         else: 
             return DatasetEvaluators([COCOEvaluator(dataset_name, output_dir=output_folder)])
 
+    @classmethod
+    def build_optimizer(cls, cfg, model):
+        return build_sgd_optimizer(cfg, model)
+
     def build_hooks(self): 
         hooks = super().build_hooks()
         hooks.append(ValidationLossHook(
@@ -86,6 +121,10 @@ class MyTrainer(DefaultTrainer):
         else:
             return DatasetEvaluators([COCOEvaluator(dataset_name, output_dir=output_folder)])
 
+    @classmethod
+    def build_optimizer(cls, cfg, model):
+        return build_sgd_optimizer(cfg, model)
+
     def build_hooks(self):
         hooks = super().build_hooks()
         hooks.insert(-1, ValidationLossHook(
@@ -108,6 +147,11 @@ class WAndBTrainer(DefaultTrainer):
       return DatasetEvaluators([COCOEvaluator(dataset_name, output_dir=output_folder)])
 
 
+  @classmethod
+  def build_optimizer(cls, cfg, model):
+    return build_sgd_optimizer(cfg, model)
+
+
   def build_hooks(self):
     hooks = super().build_hooks()
     hooks.append(ValidationLossHook(